@@ -3,8 +3,26 @@ Factories for chat_room app.
 """
 
 import factory
+from faker import Faker
+
 from ..models import Message, Room, User
 
+# Pools of fake values, generated once instead of on every factory call
+_POOL_SIZE = 64
+_faker = Faker()
+_USERNAMES = tuple(_faker.name() for _ in range(_POOL_SIZE))
+_FIRST_NAMES = tuple(_faker.name() for _ in range(_POOL_SIZE))
+_LAST_NAMES = tuple(_faker.name() for _ in range(_POOL_SIZE))
+_EMAILS = tuple(_faker.email() for _ in range(_POOL_SIZE))
+_SENTENCES = tuple(_faker.sentence() for _ in range(_POOL_SIZE))
+
+
+def _pooled(pool):
+    """
+    Get sequence declaration, which cycles through the pool.
+    """
+    return factory.Sequence(lambda n: pool[n % _POOL_SIZE])
+
 
 class UserFactory(factory.django.DjangoModelFactory):
     """
@@ -24,10 +42,12 @@ class UserFactory(factory.django.DjangoModelFactory):
 
         model = User
 
-    username = factory.Faker("name")
-    first_name = factory.Faker("name")
-    last_name = factory.Faker("name")
-    email = factory.Faker("email")
+    username = factory.Sequence(lambda n: "{0} {1}".format(
+        _USERNAMES[n % _POOL_SIZE], n
+    ))
+    first_name = _pooled(_FIRST_NAMES)
+    last_name = _pooled(_LAST_NAMES)
+    email = _pooled(_EMAILS)
 
     @factory.post_generation
     def create_user_password(obj, created, extracted, **kwargs):
@@ -47,13 +67,13 @@ class RoomFactory(factory.django.DjangoModelFactory):
     class Meta:
         model = Room
 
-    name = factory.Faker("sentence")
+    name = _pooled(_SENTENCES)
 
 
 class MessageFactory(factory.django.DjangoModelFactory):
     class Meta:
         model = Message
 
-    text = factory.Faker("sentence")
+    text = _pooled(_SENTENCES)
     room = factory.SubFactory(RoomFactory)
     author = factory.SubFactory(UserFactory)
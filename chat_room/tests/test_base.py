@@ -2,11 +2,11 @@
 This test is inherited by tests of other apps.
 """
 
-from django.urls import reverse
+from django.urls import reverse, reverse_lazy
 from rest_framework.test import APIClient, APITestCase
 from rest_framework_simplejwt.settings import api_settings
 
-from ..models import User
+from ..models import Room, User
 
 
 class APIRestAuthJWTClient(APIClient):
@@ -36,6 +36,9 @@ class APIRestAuthJWTClient(APIClient):
             return False
 
 
+MESSAGE_LIST_URL = reverse_lazy("message-list")
+
+
 class APITestBaseClass(APITestCase):
     """
     APITestBaseClass class.
@@ -43,20 +46,31 @@ class APITestBaseClass(APITestCase):
     Get APITestBaseClass.
     """
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """
-        Creeate User.
+        Creeate Users and Room.
         """
-        self.user = User.objects.create_user(
+        cls.user = User.objects.create_user(
             username="test_user",
             email="test@emil.com",
             password="password"
         )
 
-        self.user_two = User.objects.create_user(
+        cls.user_two = User.objects.create_user(
             username="test2_user",
             email="test@emil2.com",
             password="password"
         )
 
+        cls.room = Room.objects.create(name="test_room")
+
+    def auth_client(self, user):
+        """
+        Get client authenticated as user, without login request.
+        """
+        client = self.client_class()
+        client.force_authenticate(user=user)
+        return client
+
     client_class = APIRestAuthJWTClient
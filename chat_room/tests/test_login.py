@@ -22,11 +22,12 @@ class LoginTest(APITestBaseClass):
         4. Token_refresh change previous access token
     """
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """
         Creeate User.
         """
-        self.user = User.objects.create_user(
+        cls.user = User.objects.create_user(
             username="test_user",
             email="test@emil.com",
             password="password"
@@ -3,17 +3,27 @@ Tests for messages.
 """
 
 from datetime import timedelta
+from functools import lru_cache
 
 from django.urls import reverse
 from django.utils import timezone
+from freezegun import freeze_time
 from rest_framework import status
-from .test_base import APITestBaseClass
+from .test_base import MESSAGE_LIST_URL, APITestBaseClass
 
-from ..models import Comment, Message, Room
-from .factories import MessageFactory
+from ..models import Comment, Message, User
+from .factories import MessageFactory, UserFactory
 from ..serializers import MessageModelSerializer
 
 
+@lru_cache(maxsize=None)
+def message_detail_url(pk):
+    """
+    Get url of message by id.
+    """
+    return reverse("message-detail", args=[pk])
+
+
 class MessageTest(APITestBaseClass):
     """
     This test checks messages.
@@ -26,68 +36,59 @@ class MessageTest(APITestBaseClass):
         5. Successful got list by get method.
         6. Successful changed message by put method.
         7. Successful changed message by patch method.
-        8. Can't  get messages older 30 minutes.
+        8. Failed changed message by put and patch methods if current user
+           is not author.
+        9. Can't  get messages older 30 minutes.
     """
 
+    @freeze_time("2024-01-01 12:00:00")
     def test_post_message(self):
         """
         Successful create message by post method with current user.
         """
 
-        self.assertTrue(
-            self.client.login(username=self.user.username, password="password")
-        )
-
-        room = Room.objects.create(name="test_room")
-        comment = Comment.objects.create(text="test_room")
+        client = self.auth_client(self.user)
+        room = self.room
 
         post_data = {
             "text": "test_text",
             "room": room.id,
             "comments": [{"text": "fsd"}],
         }
-        Messages_count_before = Message.objects.count()
-        response = self.client.post(reverse("message-list"), post_data, format="json")
+        response = client.post(MESSAGE_LIST_URL, post_data, format="json")
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         self.assertEqual(response.data["text"], "test_text")
         self.assertEqual(response.data["room"], room.id)
         self.assertEqual(response.data["author"], self.user.id)
-        self.assertEqual(Message.objects.count(), Messages_count_before + 1)
+        self.assertEqual(Message.objects.count(), 1)
         self.assertFalse(self.user.last_message)
-        self.user.refresh_from_db()
-        self.assertEqual(
-            self.user.last_message.strftime("%m/%d/%Y, %H:%M"),
-            timezone.now().strftime("%m/%d/%Y, %H:%M"),
-        )
+        user = User.objects.only("last_message").get(pk=self.user.pk)
+        self.assertEqual(user.last_message, timezone.now())
 
     def test_post_message_without_comment(self):
         """
         Successful create message by post method without comments.
+
+        Authenticated with real JWT login.
         """
 
         self.assertTrue(
             self.client.login(username=self.user.username, password="password")
         )
-
-        room = Room.objects.create(name="test_room")
-        comment = Comment.objects.create(text="test_room")
+        room = self.room
 
         post_data = {"text": "test_text", "room": room.id}
-        Messages_count_before = Message.objects.count()
-        response = self.client.post(reverse("message-list"), post_data, format="json")
+        response = self.client.post(MESSAGE_LIST_URL, post_data, format="json")
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-        self.assertEqual(Message.objects.count(), Messages_count_before + 1)
+        self.assertEqual(response.data["author"], self.user.id)
+        self.assertEqual(Message.objects.count(), 1)
 
     def test_create_comment(self):
         """
         Successful create comment for some message.
         """
 
-        self.assertTrue(
-            self.client.login(username=self.user.username, password="password")
-        )
-
-        room = Room.objects.create(name="test_room")
+        room = self.room
         message = Message.objects.create(text="test_text", room=room)
         self.assertEqual(Message.objects.count(), 1)
         comment = Comment.objects.create(text="test_room", message=message)
@@ -106,24 +107,27 @@ class MessageTest(APITestBaseClass):
             "author": None,
             "comments": [{"text": "fsd"}],
         }
-        Messages_count_before = Message.objects.count()
-        response = self.client.post(reverse("message-list"), post_data, format="json")
+        response = self.client.post(MESSAGE_LIST_URL, post_data, format="json")
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-        self.assertEqual(Message.objects.count(), Messages_count_before)
+        self.assertEqual(Message.objects.count(), 0)
 
     def test_get_message(self):
         """
         Successful got list by get method.
         """
 
-        MessageFactory.create_batch(12)
+        author = UserFactory()
+        messages = MessageFactory.build_batch(12, room=self.room, author=author)
+        Message.objects.bulk_create(messages)
 
-        response = self.client.get(reverse("message-list"), format="json")
+        # count, page of messages and their prefetched comments
+        with self.assertNumQueries(3):
+            response = self.client.get(MESSAGE_LIST_URL, format="json")
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data["count"], 12)
         self.assertEqual(len(response.data["results"]), 10)
-        first_messages = [message.id for message in Message.objects.all()[:10]]
-        last_messages = [message.id for message in Message.objects.all()[10:]]
+        ids = list(Message.objects.values_list("id", flat=True))
+        first_messages, last_messages = set(ids[:10]), set(ids[10:])
         for message in response.data["results"]:
             self.assertIn(message["id"], first_messages)
             self.assertNotIn(message["id"], last_messages)
@@ -133,38 +137,52 @@ class MessageTest(APITestBaseClass):
         Successful changed message by put method.
         """
 
-        self.assertTrue(
-            self.client.login(username=self.user.username, password="password")
+        client = self.auth_client(self.user)
+        message = Message.objects.create(
+            text="put_test", author=self.user, room=self.room
         )
-        message = MessageFactory(text="put_test", author=self.user)
         self.assertEqual(message.text, "put_test")
-        response = self.client.put(
-            reverse("message-detail", args=[message.id]),
-            {"text": "put_test2", "comments": [{"text": "fsd"}]},
-            format="json",
-        )
+        # message, its author, message update, post_save user select and
+        # update, comments
+        with self.assertNumQueries(6):
+            response = client.put(
+                message_detail_url(message.id),
+                {"text": "put_test2", "comments": [{"text": "fsd"}]},
+                format="json",
+            )
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        message.refresh_from_db()
+        message.refresh_from_db(fields=["text"])
         self.assertEqual(message.text, "put_test2")
 
-    def test_put_message_not_author(self):
+    def test_update_message_not_author(self):
         """
-        Failed changed message by put method if current user is not author.
+        Failed changed message by put and patch methods if current user
+        is not author.
         """
 
-        self.assertTrue(
-            self.client.login(username=self.user_two.username, password="password")
+        client = self.auth_client(self.user_two)
+        message = Message.objects.create(
+            text="put_test", author=self.user, room=self.room
         )
-        message = MessageFactory(text="put_test", author=self.user)
         self.assertEqual(message.text, "put_test")
-        response = self.client.put(
-            reverse("message-detail", args=[message.id]),
-            {"text": "put_test2", "comments": [{"text": "fsd"}]},
-            format="json",
+        update_data = (
+            ("put", {"text": "put_test2", "comments": [{"text": "fsd"}]}),
+            ("patch", {"text": "put_test2"}),
         )
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-        self.assertEqual(str(response.data[0]), "Only author of message can update")
-        message.refresh_from_db()
+        for method, data in update_data:
+            with self.subTest(method=method):
+                response = getattr(client, method)(
+                    message_detail_url(message.id),
+                    data,
+                    format="json",
+                )
+                self.assertEqual(
+                    response.status_code, status.HTTP_400_BAD_REQUEST
+                )
+                self.assertEqual(
+                    str(response.data[0]), "Only author of message can update"
+                )
+        message.refresh_from_db(fields=["text"])
         self.assertEqual(message.text, "put_test")
 
     def test_patch_message(self):
@@ -172,63 +190,41 @@ class MessageTest(APITestBaseClass):
         Successful changed message by patch method.
         """
 
-        self.assertTrue(
-            self.client.login(username=self.user.username, password="password")
+        client = self.auth_client(self.user)
+        message = Message.objects.create(
+            text="put_test", author=self.user, room=self.room
         )
-        message = MessageFactory(text="put_test", author=self.user)
         self.assertEqual(message.text, "put_test")
-        response = self.client.patch(
-            reverse("message-detail", args=[message.id]),
+        response = client.patch(
+            message_detail_url(message.id),
             {"text": "put_test2"},
             format="json",
         )
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        message.refresh_from_db()
+        message.refresh_from_db(fields=["text"])
         self.assertEqual(message.text, "put_test2")
 
-    def test_patch_message_not_author(self):
-        """
-        Failed changed message by patch method if current user is not author.
-        """
-
-        self.assertTrue(
-            self.client.login(username=self.user_two.username, password="password")
-        )
-        message = MessageFactory(text="put_test", author=self.user)
-        self.assertEqual(message.text, "put_test")
-        response = self.client.patch(
-            reverse("message-detail", args=[message.id]),
-            {"text": "put_test2"},
-            format="json",
-        )
-        self.assertEqual(str(response.data[0]), "Only author of message can update")
-        message.refresh_from_db()
-        self.assertEqual(message.text, "put_test")
-
     def test_age_message(self):
         """
         Can't update messages older than 30 minutes.
         """
 
-        message = MessageFactory(
-            text="put_test", created=(timezone.now() - timedelta(minutes=30))
+        client = self.auth_client(self.user)
+        message = Message.objects.create(
+            text="put_test",
+            author=self.user,
+            room=self.room,
+            created=(timezone.now() - timedelta(minutes=30)),
         )
         self.assertEqual(message.text, "put_test")
 
-        response = self.client.put(
-            reverse("message-detail", args=[message.id]),
-            {"text": "put_test2"},
-            format="json",
-        )
-        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
-        message.refresh_from_db()
-        self.assertEqual(message.text, "put_test")
-
-        response = self.client.patch(
-            reverse("message-detail", args=[message.id]),
-            {"text": "put_test2"},
-            format="json",
-        )
-        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
-        message.refresh_from_db()
+        for method in ("put", "patch"):
+            with self.subTest(method=method):
+                response = getattr(client, method)(
+                    message_detail_url(message.id),
+                    {"text": "put_test2"},
+                    format="json",
+                )
+                self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        message.refresh_from_db(fields=["text"])
         self.assertEqual(message.text, "put_test")
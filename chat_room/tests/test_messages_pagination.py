@@ -1,52 +1,46 @@
 """
-Tests for messages.
+Tests for messages pagination.
 """
 
 from urllib.parse import urlencode
 
-from django.urls import reverse
 from rest_framework import status
 
 from ..models import Message
 from .factories import MessageFactory
-from .test_base import APITestBaseClass
+from .test_base import MESSAGE_LIST_URL, APITestBaseClass
 
 
-class MessageTest(APITestBaseClass):
+class MessagePaginationTest(APITestBaseClass):
     """
-    This test checks messages.
+    This test checks messages pagination.
+
+    Default pagination of 10 messages is checked by MessageTest.
 
     This test checks next scenarios:
-        1. Successful got 10 message as default pagination.
-        2. Successful got 1 message with parameter 1.
-        3. Failed got 12 message with parameter 12.
+        1. Successful got 1 message with parameter 1.
+        2. Failed got 12 message with parameter 12.
     """
 
-    def _build_url(self, params, url):
-        url_params = urlencode(params, True)
-        return f"{url}?{url_params}"
-
-    def test_messages_default_pagination(self):
+    @classmethod
+    def setUpTestData(cls):
         """
-        Successful got 10 message as default pagination.
+        Create messages.
         """
+        super().setUpTestData()
         MessageFactory.create_batch(12)
 
-        response = self.client.get(reverse("message-list"), format="json")
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data["count"], Message.objects.all().count())
-        self.assertEqual(Message.objects.all().count(), 12)
-        self.assertEqual(len(response.data["results"]), 10)
+    def _build_url(self, params, url):
+        url_params = urlencode(params, True)
+        return f"{url}?{url_params}"
 
     def test_messages_pagination_1_element(self):
         """
         Successful got 1 message with parameter 1.
         """
-        MessageFactory.create_batch(12)
-
         get_data = {"page_size": "1"}
         response = self.client.get(self._build_url(
-            get_data, reverse("message-list"))
+            get_data, MESSAGE_LIST_URL)
         )
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data["count"], Message.objects.all().count())
@@ -57,11 +51,9 @@ class MessageTest(APITestBaseClass):
         """
         Failed got 12 message with parameter 12.
         """
-        MessageFactory.create_batch(12)
-
         get_data = {"page_size": "12"}
         response = self.client.get(self._build_url(
-            get_data, reverse("message-list"))
+            get_data, MESSAGE_LIST_URL)
         )
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data["count"], Message.objects.all().count())
@@ -38,10 +38,13 @@ class MessageViewSet(ModelViewSet):
         Get queryset method of ChaptersModelViewSet.
 
         This method reports messages that are not older than 30 minutes
-        in PUT and Patch methods.
+        in PUT and Patch methods. Comments are prefetched only for
+        read actions, which serialize them straight from the queryset.
         """
         if self.action in ["update", "partial_update"]:
             return Message.objects.filter(
                 created__gt=(timezone.now() - timedelta(minutes=30))
             )
+        if self.action in ["list", "retrieve"]:
+            return Message.objects.prefetch_related("comments")
         return Message.objects.all()